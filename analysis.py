@@ -2,18 +2,24 @@
 analysis.py
 
 This module provides functions for analyzing and summarizing data within a pandas DataFrame. 
-Currently, it includes the `group_and_count` function, which allows for efficient grouping 
+It includes the `group_and_count` function, which allows for efficient grouping 
 and counting of data by specified columns, with optional merging capabilities for combining 
-data from multiple DataFrames.
+data from multiple DataFrames, and the `top_k` function for picking the highest-ranked rows.
 
 Functions:
 - group_and_count: Groups the data by a specified column, counts occurrences of another column 
   if specified, and returns a summary DataFrame. This function also supports merging with another 
   DataFrame prior to grouping and counting, enabling more flexible data analysis workflows.
+- group_sum_and_count: Sums and counts the values of a column per group directly on the
+  group codes, as the per-group totals behind sums and means.
+- top_k: Returns the rows with the k largest values of a column, ordered from largest to
+  smallest, without sorting the whole DataFrame.
 
 Dependencies:
+- numpy
 - pandas
 """
+import numpy as np
 import pandas as pd
 
 
@@ -39,6 +45,7 @@ def group_and_count(
     - count_column (str, optional): The column name to count. If None, the function counts 
       the occurrences of the group.
     - merge_df (pd.DataFrame, optional): A DataFrame to merge with the input DataFrame.
+      Its merge_column_right values must be unique; a pandas MergeError is raised otherwise.
     - merge_column_left (str, optional): The column name in the input DataFrame to merge on.
     - merge_column_right (str, optional): The column name in the merge DataFrame to merge on.
     - count_column_name (str, optional): The name of the resulting count column. Defaults 
@@ -46,19 +53,119 @@ def group_and_count(
 
     Returns:
     - pd.DataFrame: A DataFrame with the grouped counts, indexed by the groupby_column.
+      Unused categories of a categorical groupby_column are not included.
     """
 
-    # Merge if specified
+    # Merge if specified; merge_df is a lookup table, so each row matches at most once
     if merge_df is not None and merge_column_left and merge_column_right:
         df = pd.merge(df, merge_df, how='left',
-                      left_on=merge_column_left, right_on=merge_column_right)
+                      left_on=merge_column_left, right_on=merge_column_right,
+                      validate='many_to_one')
 
-    # Perform grouping and counting
-    if count_column:
-        count_df = df.groupby(groupby_column)[
-            count_column].count().reset_index(name=count_column_name)
+    # Categorical keys are counted directly from their codes, skipping the
+    # GroupBy machinery; categories without any rows are left out, as with
+    # groupby(observed=True)
+    if isinstance(df[groupby_column].dtype, pd.CategoricalDtype):
+        keys = df[groupby_column]
+        group_sizes = keys.value_counts(sort=False)
+        if count_column:
+            counts = keys[df[count_column].notna()].value_counts(sort=False)
+        else:
+            counts = group_sizes
+        counts = counts[group_sizes > 0]
+        counts.index.name = groupby_column
     else:
-        count_df = df.groupby(groupby_column).size(
-        ).reset_index(name=count_column_name)
+        # Perform grouping and counting
+        grouped = df.groupby(groupby_column, observed=True)
+        if count_column:
+            counts = grouped[count_column].count()
+        else:
+            counts = grouped.size()
 
-    return count_df.set_index(groupby_column)
+    # The counts are already indexed by the group key
+    return counts.rename(count_column_name).to_frame()
+
+
+def group_sum_and_count(
+    df: pd.DataFrame,
+    groupby_column: str,
+    value_column: str
+) -> pd.DataFrame:
+    """
+    Sum and count the non-missing values of a column per group.
+
+    This function works on the integer group codes (the category codes of a
+    categorical column, or pd.factorize otherwise) and accumulates the totals
+    with np.bincount, avoiding the GroupBy machinery and any sort of the rows.
+    Rows with a missing group key are ignored, and groups without any rows are
+    left out, as with groupby(observed=True).
+
+    Parameters:
+    - df (pd.DataFrame): The DataFrame to aggregate.
+    - groupby_column (str): The column name to group by.
+    - value_column (str): The numeric column to sum and count.
+
+    Returns:
+    - pd.DataFrame: A DataFrame indexed by the groupby_column with a 'SUM' column (integer
+      for integer values) and a 'COUNT' column of non-missing values.
+    """
+    keys = df[groupby_column]
+    if isinstance(keys.dtype, pd.CategoricalDtype):
+        codes, uniques = keys.cat.codes.to_numpy(), keys.cat.categories
+    else:
+        codes, uniques = pd.factorize(keys, sort=True)
+    values = df[value_column].to_numpy(dtype=np.float64)
+
+    # Missing keys have code -1 and are skipped, as are missing values; the
+    # masking passes are only paid when there is something to skip
+    num_groups = len(uniques)
+    has_key = codes >= 0
+    valid = has_key & ~np.isnan(values)
+    if valid.all():
+        group_rows = None
+    else:
+        group_rows = np.bincount(codes[has_key], minlength=num_groups)
+        codes, values = codes[valid], values[valid]
+    counts = np.bincount(codes, minlength=num_groups)
+    sums = np.bincount(codes, weights=values, minlength=num_groups)
+    if group_rows is None:
+        group_rows = counts
+    if pd.api.types.is_integer_dtype(df[value_column].dtype):
+        sums = sums.astype(np.int64)
+
+    result = pd.DataFrame({'SUM': sums, 'COUNT': counts},
+                          index=pd.Index(uniques, name=groupby_column))
+    return result[group_rows > 0]
+
+
+def top_k(df: pd.DataFrame, column: str, k: int = 3) -> pd.DataFrame:
+    """
+    Select the rows with the k largest values of a column.
+
+    This function partitions the column values to find the k-th largest value, so
+    only the rows at or above it are sorted, instead of sorting the whole DataFrame.
+    Ties are broken by position, so the result matches `nlargest(k, column)`. Rows
+    with a missing value in the column are never selected, and a negative k selects
+    no rows.
+
+    Parameters:
+    - df (pd.DataFrame): The DataFrame to select rows from.
+    - column (str): The numeric column to rank the rows by.
+    - k (int, optional): The number of rows to return. Defaults to 3.
+
+    Returns:
+    - pd.DataFrame: The selected rows, ordered from the largest value to the smallest.
+    """
+    k = max(k, 0)
+    values = df[column].to_numpy(dtype=np.float64)
+    candidates = np.flatnonzero(~np.isnan(values))
+
+    # Partition to find the k-th largest value and keep every row at or above it,
+    # so rows tied with it are all kept. The candidates stay in row order, so the
+    # stable sort puts the earliest of the tied rows first
+    if 0 < k < len(candidates):
+        kth_value = -np.partition(-values[candidates], k - 1)[k - 1]
+        candidates = candidates[values[candidates] >= kth_value]
+    order = candidates[np.argsort(-values[candidates], kind='stable')]
+
+    return df.iloc[order[:k]]
@@ -9,6 +9,13 @@ Constants:
 - FLIGHTS_CSV_PATH (str): The file path to the flights data CSV file.
 - AIRPORTS_CSV_PATH (str): The file path to the airports data CSV file.
 - AIRLINES_CSV_PATH (str): The file path to the airlines data CSV file.
+- FLIGHTS_CACHE_PATH (str): The directory of the Parquet cache of the flights data, partitioned
+  by origin airport. It is rebuilt when the flights CSV is newer; delete it to force a rebuild.
+- FLIGHTS_COLUMNS (list): The flights CSV columns used by the analysis; only these are parsed.
+- FLIGHTS_DTYPES (dict): Compact dtypes for the flights columns; the string key columns
+  are stored as categories.
+- FLIGHTS_BLOCK_SIZE (int): The number of bytes parsed per record batch when streaming the
+  flights CSV.
 - FILTER_AIRPORTS (list): A list of airport codes to filter flights data by origin airport.
 - DELAY_THRESHOLD (int): The delay threshold in minutes (defaulted to 24 hours) used to 
   classify flights as delayed.
@@ -20,6 +27,23 @@ easier adjustment and management of key settings in one place.
 FLIGHTS_CSV_PATH = 'assets/flights.csv'
 AIRPORTS_CSV_PATH = 'assets/airports.csv'
 AIRLINES_CSV_PATH = 'assets/airlines.csv'
+FLIGHTS_CACHE_PATH = 'assets/flights_parquet'
+
+# Columns read from the flights CSV
+FLIGHTS_COLUMNS = [
+    'YEAR', 'MONTH', 'DAY', 'ORIGIN_AIRPORT', 'AIRLINE',
+    'SCHEDULED_DEPARTURE', 'DEPARTURE_DELAY'
+]
+FLIGHTS_DTYPES = {
+    'YEAR': 'int16',
+    'MONTH': 'int8',
+    'DAY': 'int8',
+    'ORIGIN_AIRPORT': 'category',
+    'AIRLINE': 'category',
+    'SCHEDULED_DEPARTURE': 'int16',
+    'DEPARTURE_DELAY': 'float32',
+}
+FLIGHTS_BLOCK_SIZE = 16 * 1024 * 1024  # In bytes
 
 # Parameters
 FILTER_AIRPORTS = ['BOS', 'JFK', 'SFO', 'LAX']
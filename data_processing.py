@@ -21,6 +21,8 @@ Parameters for data_preprocess:
 - additional_columns (dict): Allows dynamic column creation by specifying columns to
   add with either static values or functions applied to existing columns.
 - columns_to_drop (list): Names of columns to remove from the DataFrame.
+- expression_columns (dict): Adds columns computed from string expressions over the
+  existing columns, evaluated with DataFrame.eval.
 
 Returns:
 - pd.DataFrame: The cleaned and preprocessed DataFrame ready for further analysis.
@@ -28,10 +30,16 @@ Returns:
 This module is designed for use cases where data preprocessing involves multiple, customizable
 steps to prepare data for analysis or modeling.
 """
+import re
 from typing import Optional, Dict, Any
+import numpy as np
 import pandas as pd
 
 
+# Date components addressed by the strptime directives of a datetime format
+_DATE_DIRECTIVES = {'%Y': 'year', '%m': 'month', '%d': 'day'}
+
+
 def data_preprocess(
     df: pd.DataFrame,
     dropna: bool = True,
@@ -41,6 +49,7 @@ def data_preprocess(
     datetime_column_info: Optional[Dict[str, Any]] = None,
     additional_columns: Optional[Dict[str, Any]] = None,
     columns_to_drop: Optional[list] = None,
+    expression_columns: Optional[Dict[str, str]] = None,
 ) -> pd.DataFrame:
     """
     Generic data preprocessing function.
@@ -48,7 +57,8 @@ def data_preprocess(
     This function applies various preprocessing steps to the input DataFrame,
     including dropping missing values, filtering rows based on column values,
     applying a delay threshold, converting columns to datetime format,
-    adding additional computed columns, and dropping specified columns.
+    adding additional computed columns, evaluating expression columns, and
+    dropping specified columns.
 
     Parameters:
     - df (pd.DataFrame): The DataFrame to preprocess.
@@ -62,35 +72,59 @@ def data_preprocess(
     - additional_columns (dict, optional): A dictionary of additional columns to add to the 
       DataFrame, where keys are column names and values are either callables or static values.
     - columns_to_drop (list, optional): A list of column names to drop from the DataFrame.
+    - expression_columns (dict, optional): A dictionary of columns to add, where keys are
+      column names and values are expressions such as 'DEPARTURE_DELAY >= 15', evaluated
+      with DataFrame.eval (numexpr is used when installed). Boolean results are stored as
+      int8 0/1 flags.
 
     Returns:
-    - pd.DataFrame: The preprocessed DataFrame.
+    - pd.DataFrame: The preprocessed DataFrame. When rows are dropped or filtered, the
+      surviving rows are renumbered from 0.
     """
 
+    # Collect the row masks for missing values, column filters and the delay
+    # threshold
+    row_masks = []
     if dropna:
-        df = df.dropna()
-
-    # Apply column filters
+        row_masks.append(df.notna().all(axis=1).to_numpy())
     if filter_column_values:
         for col, values in filter_column_values.items():
-            df = df[df[col].isin(values)]
-
-    # Filter by delay threshold
+            row_masks.append(df[col].isin(values).to_numpy())
     if delay_threshold_column and delay_threshold is not None:
-        df = df[df[delay_threshold_column] <= delay_threshold]
+        row_masks.append(
+            (df[delay_threshold_column] <= delay_threshold).to_numpy())
+
+    # Select the surviving rows in one pass; take() does not flag the result as
+    # a slice of the input, so the columns added below do not warn. The new
+    # frame is ours, so its rows are renumbered in place without another copy
+    if row_masks:
+        mask = np.logical_and.reduce(row_masks)
+        df = df.take(np.flatnonzero(mask))
+        df.reset_index(drop=True, inplace=True)
 
     # Convert to datetime if specified
     if datetime_column_info:
         date_columns = datetime_column_info.get('columns', [])
         time_column = datetime_column_info.get('time_column')
         datetime_format = datetime_column_info.get('format', '%Y-%m-%d')
-        df[time_column] = pd.to_datetime(
-            df[date_columns[0]].astype(str) + '-' +
-            df[date_columns[1]].astype(str) + '-' +
-            df[date_columns[2]].astype(str) + ' ' +
-            df[time_column].astype(str).str.zfill(4),
-            format=datetime_format
-        )
+        directives = re.findall(r'%.', datetime_format)
+        if (sorted(directives[:3]) == sorted(_DATE_DIRECTIVES)
+                and directives[3:] == ['%H', '%M']):
+            # Assemble the timestamps from the integer date parts and the
+            # HHMM time instead of formatting and re-parsing a string per row
+            hhmm = df[time_column].astype('int32')
+            parts = {_DATE_DIRECTIVES[directive]: df[col]
+                     for directive, col in zip(directives, date_columns)}
+            df[time_column] = pd.to_datetime(
+                pd.DataFrame({**parts, 'hour': hhmm // 100, 'minute': hhmm % 100}))
+        else:
+            df[time_column] = pd.to_datetime(
+                df[date_columns[0]].astype(str) + '-' +
+                df[date_columns[1]].astype(str) + '-' +
+                df[date_columns[2]].astype(str) + ' ' +
+                df[time_column].astype(str).str.zfill(4),
+                format=datetime_format
+            )
 
     # Add additional columns
     if additional_columns:
@@ -100,6 +134,15 @@ def data_preprocess(
             else:
                 df[col] = func_or_value
 
+    # Evaluate expression columns; the boolean buffer is reinterpreted as int8
+    # rather than converted. Scalar results are assigned as static values
+    if expression_columns:
+        for col, expression in expression_columns.items():
+            result = df.eval(expression)
+            if isinstance(result, pd.Series) and result.dtype == bool:
+                result = result.to_numpy().view(np.int8)
+            df[col] = result
+
     # Drop columns if specified
     if columns_to_drop:
         df = df.drop(columns=columns_to_drop)
@@ -18,26 +18,173 @@ Steps:
 
 Modules:
 - data_processing: For data cleaning and preparation.
-- analysis: For specific aggregation and counting operations.
+- analysis: For per-group aggregation and ranking of the results.
 - config: Contains configuration settings like file paths and filter parameters.
 
 Execution:
 Run this script directly to perform the analysis.
 """
+import os
+import shutil
+from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.dataset as ds
 from data_processing import data_preprocess
-from analysis import group_and_count
+from analysis import group_sum_and_count, top_k
 import config
 
 
+# The flights cache is partitioned by origin airport, with the codes kept as strings
+_FLIGHTS_PARTITIONING = ds.partitioning(
+    pa.schema([('ORIGIN_AIRPORT', pa.string())]), flavor='hive')
+
+
+def _flights_column_types() -> Dict[str, pa.DataType]:
+    """
+    Get the Arrow types the flights columns are read and cached as.
+
+    Categorical columns are kept as strings in the cache and only become
+    categories once they are loaded.
+
+    Returns:
+    - Dict[str, pa.DataType]: The Arrow type of each column in config.FLIGHTS_DTYPES.
+    """
+    return {col: pa.string() if dtype == 'category' else pa.from_numpy_dtype(np.dtype(dtype))
+            for col, dtype in config.FLIGHTS_DTYPES.items()}
+
+
+def _flights_cache_is_current() -> bool:
+    """
+    Check whether the Parquet cache at config.FLIGHTS_CACHE_PATH can be used.
+
+    The cache is current when it is newer than the flights CSV and holds exactly
+    the columns in config.FLIGHTS_COLUMNS, with the types set in
+    config.FLIGHTS_DTYPES.
+
+    Returns:
+    - bool: True if the cache can be read as is, False if it must be rebuilt.
+    """
+    if (not os.path.isdir(config.FLIGHTS_CACHE_PATH) or
+            os.path.getmtime(config.FLIGHTS_CACHE_PATH) <
+            os.path.getmtime(config.FLIGHTS_CSV_PATH)):
+        return False
+
+    schema = ds.dataset(config.FLIGHTS_CACHE_PATH, format='parquet',
+                        partitioning=_FLIGHTS_PARTITIONING).schema
+    if sorted(schema.names) != sorted(config.FLIGHTS_COLUMNS):
+        return False
+    return all(schema.field(col).type == column_type
+               for col, column_type in _flights_column_types().items()
+               if col in config.FLIGHTS_COLUMNS)
+
+
+def build_flights_cache() -> None:
+    """
+    Convert the flights CSV into the Parquet dataset at config.FLIGHTS_CACHE_PATH.
+
+    The CSV is streamed with the PyArrow reader and written batch by batch,
+    partitioned by origin airport, so later loads only read the files of the
+    airports being analyzed. The rows keep their CSV order within each partition,
+    so every build gives the same cache. The dataset is written to a temporary
+    directory and then moved into place, so an interrupted build never leaves a
+    partial cache.
+    """
+    reader = pv.open_csv(
+        config.FLIGHTS_CSV_PATH,
+        read_options=pv.ReadOptions(block_size=config.FLIGHTS_BLOCK_SIZE),
+        convert_options=pv.ConvertOptions(
+            include_columns=config.FLIGHTS_COLUMNS,
+            column_types=_flights_column_types()
+        )
+    )
+
+    tmp_path = config.FLIGHTS_CACHE_PATH + '.tmp'
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    ds.write_dataset(
+        reader,
+        tmp_path,
+        format='parquet',
+        partitioning=_FLIGHTS_PARTITIONING,
+        preserve_order=True,
+        file_options=ds.ParquetFileFormat().make_write_options(compression='zstd')
+    )
+    shutil.rmtree(config.FLIGHTS_CACHE_PATH, ignore_errors=True)
+    os.replace(tmp_path, config.FLIGHTS_CACHE_PATH)
+
+
+def _sorted_dictionary(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    """
+    Dictionary-encode a string column in Arrow, with the dictionary sorted.
+
+    Converting the result to pandas gives a categorical built straight from the
+    Arrow codes, with the same sorted categories `astype('category')` would give,
+    without first materializing a Python string object per row.
+
+    Parameters:
+    - column (pa.ChunkedArray): The column to encode. It must not contain nulls.
+
+    Returns:
+    - pa.ChunkedArray: The dictionary-encoded column.
+    """
+    values = pc.unique(column)
+    values = values.take(pc.sort_indices(values))
+    codes = pc.index_in(column, value_set=values)
+    # The type is passed explicitly, as an empty column may have no chunks
+    return pa.chunked_array([pa.DictionaryArray.from_arrays(chunk, values)
+                             for chunk in codes.chunks],
+                            type=pa.dictionary(codes.type, values.type))
+
+
+def load_flights() -> pd.DataFrame:
+    """
+    Load the flights data from the Parquet cache, keeping only the rows that
+    survive the row-level filters.
+
+    The cache is rebuilt from the CSV when it is missing, older than the CSV, or
+    does not hold the configured columns and types.
+    The origin-airport filter skips the other airports' partitions entirely, and
+    missing values and the delay threshold are filtered batch by batch while the
+    dataset is scanned, so only the surviving rows are ever held in memory. The
+    categorical columns are dictionary-encoded in Arrow before the conversion.
+
+    Returns:
+    - pd.DataFrame: The filtered flights data.
+    """
+    if not _flights_cache_is_current():
+        build_flights_cache()
+
+    row_filter = (ds.field('ORIGIN_AIRPORT').isin(config.FILTER_AIRPORTS) &
+                  (ds.field('DEPARTURE_DELAY') <= config.DELAY_THRESHOLD))
+    for column in config.FLIGHTS_COLUMNS:
+        row_filter &= ds.field(column).is_valid()
+
+    dataset = ds.dataset(config.FLIGHTS_CACHE_PATH, format='parquet',
+                         partitioning=_FLIGHTS_PARTITIONING)
+    flights_table = dataset.to_table(columns=config.FLIGHTS_COLUMNS, filter=row_filter)
+
+    # Categories are assigned after filtering so they only hold the kept values
+    for col, dtype in config.FLIGHTS_DTYPES.items():
+        if dtype == 'category':
+            flights_table = flights_table.set_column(
+                flights_table.schema.get_field_index(col), col,
+                _sorted_dictionary(flights_table[col]))
+    return flights_table.to_pandas()
+
+
 def main() -> None:
     """
     Main function to load flight data, preprocess it, analyze delays, and 
     summarize the results by airport and airline.
 
     This function performs the following tasks:
-    1. Load flight, airport, and airline data from CSV files.
-    2. Preprocess the flight data to clean and filter it.
+    1. Load flight, airport, and airline data, reading the flights from their
+       Parquet cache and filtering them while they are scanned.
+    2. Preprocess the flight data to build the derived columns.
     3. Calculate and print the number of delayed flights and average delay time.
     4. Count and display the number of flights per airport.
     5. Display the top 3 airports by the number of flights.
@@ -47,29 +194,43 @@ def main() -> None:
     9. Display the top 3 airports with the highest average delay.
     """
 
-    # Load data
-    flights_df: pd.DataFrame = pd.read_csv(
-        config.FLIGHTS_CSV_PATH, low_memory=False)
-    airports_df: pd.DataFrame = pd.read_csv(config.AIRPORTS_CSV_PATH)
-    airlines_df: pd.DataFrame = pd.read_csv(config.AIRLINES_CSV_PATH)
+    # Load data, filtering the flights while they are scanned. The PyArrow
+    # readers release the GIL while parsing, so the small reference files are
+    # read concurrently with the flights data
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        flights_future = executor.submit(load_flights)
+        airports_future = executor.submit(
+            pd.read_csv, config.AIRPORTS_CSV_PATH, engine='pyarrow')
+        airlines_future = executor.submit(
+            pd.read_csv, config.AIRLINES_CSV_PATH, engine='pyarrow')
+        flights_df: pd.DataFrame = flights_future.result()
+        airports_df: pd.DataFrame = airports_future.result()
+        airlines_df: pd.DataFrame = airlines_future.result()
 
-    # Preprocess the flights data
+    # Preprocess the flights data (rows were already filtered during loading)
     flights_df_cleaned: pd.DataFrame = data_preprocess(
         flights_df,
-        dropna=True,
-        filter_column_values={'ORIGIN_AIRPORT': config.FILTER_AIRPORTS},
-        delay_threshold_column='DEPARTURE_DELAY',
-        delay_threshold=config.DELAY_THRESHOLD,
+        dropna=False,
         datetime_column_info={
             'columns': ['DAY', 'MONTH', 'YEAR'],
             'time_column': 'SCHEDULED_DEPARTURE',
             'format': '%d-%m-%Y %H%M'
         },
+        # Compare on the raw array and reinterpret the boolean result as int8:
+        # one pass over DEPARTURE_DELAY and no int64 intermediate
         additional_columns={'IS_DELAYED': lambda x: (
-            x['DEPARTURE_DELAY'] >= 15).astype(int)},
+            x['DEPARTURE_DELAY'].to_numpy() >= 15).view(np.int8)},
         columns_to_drop=['YEAR', 'MONTH', 'DAY']
     )
 
+    # Keep only the reference rows for codes present in the flights data, indexed
+    # by their code so lookups are index-aligned joins. The categories were
+    # assigned after filtering, so they are exactly the codes present
+    airports_small: pd.DataFrame = airports_df[airports_df['IATA_CODE'].isin(
+        flights_df_cleaned['ORIGIN_AIRPORT'].cat.categories)].set_index('IATA_CODE')
+    airlines_small: pd.DataFrame = airlines_df[airlines_df['IATA_CODE'].isin(
+        flights_df_cleaned['AIRLINE'].cat.categories)].set_index('IATA_CODE')
+
     # Display initial overview of cleaned data
     print("Cleaned Flights Data Sample:")
     print(flights_df_cleaned.head())
@@ -83,52 +244,51 @@ def main() -> None:
     avg_delay: float = flights_df_cleaned['DEPARTURE_DELAY'].mean()
     print(f"Average Departure Delay (minutes): {avg_delay:.2f}")
 
-    # Count and display the number of flights per airport
-    num_flights_df: pd.DataFrame = group_and_count(
-        flights_df_cleaned,
-        groupby_column='ORIGIN_AIRPORT',
-        merge_df=airports_df,
-        merge_column_left='ORIGIN_AIRPORT',
-        merge_column_right='IATA_CODE',
-        count_column_name='NUM_FLIGHTS'
-    )
+    # Aggregate the per-airport metrics in one pass over the airport codes.
+    # Flights with a missing delay were dropped on load, so the delay count is
+    # the number of flights
+    airport_totals: pd.DataFrame = group_sum_and_count(
+        flights_df_cleaned, 'ORIGIN_AIRPORT', 'DEPARTURE_DELAY')
+    airport_agg: pd.DataFrame = pd.DataFrame({
+        'NUM_FLIGHTS': airport_totals['COUNT'],
+        'AVG_DELAY': airport_totals['SUM'] / airport_totals['COUNT']
+    })
+
+    # Display the number of flights per airport
+    num_flights_df: pd.DataFrame = airport_agg[['NUM_FLIGHTS']]
     print("\nNumber of Flights per Airport:")
     print(num_flights_df)
 
     # Display the top 3 airports by number of flights
-    top_3_airports: pd.DataFrame = num_flights_df.nlargest(3, 'NUM_FLIGHTS')
+    top_3_airports: pd.DataFrame = top_k(num_flights_df, 'NUM_FLIGHTS')
     print("\nTop 3 Airports by Number of Flights:")
     print(top_3_airports)
 
     # Number of delayed flights per airline
-    delayed_flights_per_airline: pd.DataFrame = flights_df_cleaned.groupby(
-        'AIRLINE')['IS_DELAYED'].sum().reset_index()
-    delayed_flights_per_airline = delayed_flights_per_airline.merge(
-        airlines_df, left_on='AIRLINE', right_on='IATA_CODE')
+    delayed_flights_per_airline: pd.DataFrame = group_sum_and_count(
+        flights_df_cleaned, 'AIRLINE', 'IS_DELAYED')['SUM'].reset_index()
+    delayed_flights_per_airline['AIRLINE_NAME'] = delayed_flights_per_airline[
+        'AIRLINE'].map(airlines_small['AIRLINE'])
     delayed_flights_per_airline.rename(
-        columns={'IS_DELAYED': 'NUM_DELAYED_FLIGHTS'}, inplace=True)
+        columns={'SUM': 'NUM_DELAYED_FLIGHTS'}, inplace=True)
     print("\nNumber of Delayed Flights per Airline:")
     print(delayed_flights_per_airline)
 
     # Display the top 3 airlines by number of delayed flights
-    top_3_delayed_airlines: pd.DataFrame = delayed_flights_per_airline.nlargest(
-        3, 'NUM_DELAYED_FLIGHTS')
+    top_3_delayed_airlines: pd.DataFrame = top_k(
+        delayed_flights_per_airline, 'NUM_DELAYED_FLIGHTS')
     print("\nTop 3 Airlines by Number of Delayed Flights:")
     print(top_3_delayed_airlines)
 
     # Average delay per airport
-    avg_delay_per_airport: pd.DataFrame = flights_df_cleaned.groupby(
-        'ORIGIN_AIRPORT')['DEPARTURE_DELAY'].mean().reset_index()
-    avg_delay_per_airport = avg_delay_per_airport.merge(
-        airports_df, left_on='ORIGIN_AIRPORT', right_on='IATA_CODE')
-    avg_delay_per_airport.rename(
-        columns={'DEPARTURE_DELAY': 'AVG_DELAY'}, inplace=True)
+    avg_delay_per_airport: pd.DataFrame = airport_agg[['AVG_DELAY']].reset_index().join(
+        airports_small, on='ORIGIN_AIRPORT', how='inner')
     print("\nAverage Departure Delay per Airport:")
     print(avg_delay_per_airport)
 
     # Display the top 3 airports with the highest average delay
-    top_3_delayed_airports: pd.DataFrame = avg_delay_per_airport.nlargest(
-        3, 'AVG_DELAY')
+    top_3_delayed_airports: pd.DataFrame = top_k(
+        avg_delay_per_airport, 'AVG_DELAY')
     print("\nTop 3 Airports by Average Departure Delay:")
     print(top_3_delayed_airports)
 
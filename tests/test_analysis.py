@@ -5,16 +5,24 @@ This module contains tests for the `group_and_count` function, which performs
 grouping and counting on a DataFrame.
 
 Classes:
-    TestAnalysis: Unit tests for `group_and_count` function.
+    TestAnalysis: Unit tests for `group_and_count`, `group_sum_and_count` and `top_k`
+    functions.
 
 Functions:
     test_group_and_count: Tests the grouping and counting functionality of 
     `group_and_count`.
+    test_group_and_count_categorical: Tests `group_and_count` on a categorical
+    group column.
+    test_group_and_count_merge: Tests that `group_and_count` rejects a merge table
+    with duplicate keys.
+    test_group_sum_and_count: Tests `group_sum_and_count` against a pandas groupby.
+    test_top_k: Tests that `top_k` selects the same rows as `DataFrame.nlargest`.
 """
 
 import unittest
+import numpy as np
 import pandas as pd
-from analysis import group_and_count
+from analysis import group_and_count, group_sum_and_count, top_k
 
 
 class TestAnalysis(unittest.TestCase):
@@ -61,6 +69,124 @@ class TestAnalysis(unittest.TestCase):
         # Verify columns are as expected
         self.assertListEqual(result_df.columns.tolist(), ['ORIGIN_AIRPORT', 'NUM_FLIGHTS'])
 
+    def test_group_and_count_categorical(self):
+        """
+        Tests that a categorical group column gives the same counts as an object one.
+
+        This method verifies that the categorical fast path returns the same counts,
+        index name, and column name as the generic groupby path, and that unused
+        categories are left out of the result.
+        """
+        categorical_df = self.sample_flights_df.astype({
+            'ORIGIN_AIRPORT': pd.CategoricalDtype(['JFK', 'LAX', 'ORD', 'SEA'])
+        })
+        result_df = group_and_count(
+            categorical_df,
+            groupby_column='ORIGIN_AIRPORT',
+            count_column_name='NUM_FLIGHTS'
+        )
+        expected_df = group_and_count(
+            self.sample_flights_df,
+            groupby_column='ORIGIN_AIRPORT',
+            count_column_name='NUM_FLIGHTS'
+        )
+
+        self.assertEqual(result_df.index.name, 'ORIGIN_AIRPORT')
+        self.assertDictEqual(result_df['NUM_FLIGHTS'].to_dict(),
+                             expected_df['NUM_FLIGHTS'].to_dict())
+
+    def test_group_and_count_merge(self):
+        """
+        Tests that `group_and_count` validates the merge table keys.
+
+        This method verifies that merging on unique keys keeps the group counts
+        unchanged, and that duplicate keys raise a `MergeError` instead of
+        silently inflating the counts.
+        """
+        airports_df = pd.DataFrame({
+            'IATA_CODE': ['JFK', 'LAX', 'ORD'],
+            'CITY': ['New York', 'Los Angeles', 'Chicago']
+        })
+        merge_kwargs = {
+            'groupby_column': 'ORIGIN_AIRPORT',
+            'merge_column_left': 'ORIGIN_AIRPORT',
+            'merge_column_right': 'IATA_CODE',
+            'count_column_name': 'NUM_FLIGHTS'
+        }
+
+        result_df = group_and_count(self.sample_flights_df, merge_df=airports_df, **merge_kwargs)
+        self.assertDictEqual(result_df['NUM_FLIGHTS'].to_dict(), {'JFK': 2, 'LAX': 2, 'ORD': 1})
+
+        with self.assertRaises(pd.errors.MergeError):
+            group_and_count(self.sample_flights_df,
+                            merge_df=pd.concat([airports_df, airports_df]), **merge_kwargs)
+
+    def test_group_sum_and_count(self):
+        """
+        Tests the `group_sum_and_count` function against `groupby().agg(['sum', 'count'])`.
+
+        This method verifies that the sums and counts match pandas for object and
+        categorical keys, that missing keys and values are skipped, that integer
+        values give integer sums, and that unused categories are left out.
+        """
+        delays_df = pd.DataFrame({
+            'ORIGIN_AIRPORT': ['JFK', 'LAX', None, 'JFK', 'ORD', 'LAX'],
+            'DEPARTURE_DELAY': [20.0, None, 5.0, 30.0, 0.0, -5.0],
+            'IS_DELAYED': [1, 0, 0, 1, 0, 0]
+        })
+        categorical_df = delays_df.astype({
+            'ORIGIN_AIRPORT': pd.CategoricalDtype(['JFK', 'LAX', 'ORD', 'SEA'])
+        })
+
+        for df in (delays_df, categorical_df):
+            for value_column in ('DEPARTURE_DELAY', 'IS_DELAYED'):
+                result_df = group_sum_and_count(df, 'ORIGIN_AIRPORT', value_column)
+                expected_df = df.groupby('ORIGIN_AIRPORT', observed=True)[
+                    value_column].agg(['sum', 'count'])
+
+                self.assertListEqual(result_df.index.tolist(), ['JFK', 'LAX', 'ORD'])
+                self.assertListEqual(result_df['SUM'].tolist(), expected_df['sum'].tolist())
+                self.assertListEqual(result_df['COUNT'].tolist(), expected_df['count'].tolist())
+
+        self.assertEqual(
+            group_sum_and_count(delays_df, 'ORIGIN_AIRPORT', 'IS_DELAYED')['SUM'].dtype, 'int64')
+
+    def test_top_k(self):
+        """
+        Tests the `top_k` function against `DataFrame.nlargest`.
+
+        This method verifies that `top_k` returns the same rows in the same order as
+        `nlargest`, including when values are tied, that a k larger than the DataFrame
+        returns every row with a value, skipping missing values, and that a negative
+        k returns no rows.
+        """
+        delays_df = pd.DataFrame({
+            'ORIGIN_AIRPORT': ['JFK', 'LAX', 'ORD', 'SFO', 'BOS'],
+            'AVG_DELAY': [12.1, 10.7, None, 11.2, 9.6]
+        })
+
+        for k in (1, 3):
+            pd.testing.assert_frame_equal(
+                top_k(delays_df, 'AVG_DELAY', k),
+                delays_df.nlargest(k, 'AVG_DELAY')
+            )
+
+        self.assertListEqual(
+            top_k(delays_df, 'AVG_DELAY', 10)['ORIGIN_AIRPORT'].tolist(),
+            ['JFK', 'SFO', 'LAX', 'BOS']
+        )
+        self.assertTrue(top_k(delays_df, 'AVG_DELAY', -1).empty)
+
+        # Tied values keep the earliest rows first, as nlargest(keep='first') does
+        tied_df = pd.DataFrame({
+            'VALUE': np.random.default_rng(0).integers(0, 5, 1000)
+        })
+        for k in range(1, 50):
+            pd.testing.assert_frame_equal(
+                top_k(tied_df, 'VALUE', k),
+                tied_df.nlargest(k, 'VALUE')
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
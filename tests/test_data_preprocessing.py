@@ -10,9 +10,14 @@ Classes:
 Functions:
     test_data_preprocess: Tests various data preprocessing steps including filtering,
                           column addition, and datetime handling.
+    test_data_preprocess_expression_columns: Tests columns computed from string
+                          expressions.
+    test_data_preprocess_datetime_parts: Tests timestamps assembled from integer
+                          date parts against `datetime.strptime`.
 """
 
 import unittest
+from datetime import datetime
 import pandas as pd
 from data_processing import data_preprocess
 
@@ -81,6 +86,70 @@ class TestDataProcessing(unittest.TestCase):
         # Print processed DataFrame for debugging (optional)
         print(processed_df)
 
+    def test_data_preprocess_expression_columns(self):
+        """
+        Tests the `expression_columns` option of the `data_preprocess` function.
+
+        This method verifies:
+        - Boolean expressions are stored as int8 0/1 flags.
+        - Numeric expressions keep their computed values.
+        - Expressions that evaluate to a scalar are assigned to every row.
+        """
+        processed_df = data_preprocess(
+            self.sample_flights_df,
+            dropna=False,
+            expression_columns={
+                'IS_DELAYED': 'DEPARTURE_DELAY >= 15',
+                'DELAY_HOURS': 'DEPARTURE_DELAY / 60',
+                'CONSTANT': '1 + 1'
+            }
+        )
+
+        self.assertEqual(processed_df['IS_DELAYED'].dtype, 'int8')
+        self.assertListEqual(processed_df['IS_DELAYED'].tolist(), [1, 0, 1, 0])
+        self.assertListEqual(processed_df['DELAY_HOURS'].tolist(),
+                             (self.sample_flights_df['DEPARTURE_DELAY'] / 60).tolist())
+        self.assertListEqual(processed_df['CONSTANT'].tolist(), [2, 2, 2, 2])
+
+    def test_data_preprocess_datetime_parts(self):
+        """
+        Tests the datetime conversion of the `data_preprocess` function on integer
+        date parts.
+
+        This method verifies, for more than one order of the date directives, that the
+        timestamps match parsing the zero-padded string with `datetime.strptime`,
+        including times without padding (such as 5 for 00:05) and a leap day.
+        """
+        parts_df = pd.DataFrame({
+            'SCHEDULED_DEPARTURE': [5, 1430, 615, 2359],
+            'YEAR': [2020, 2015, 2016, 2015],
+            'MONTH': [2, 12, 7, 1],
+            'DAY': [29, 31, 4, 1]
+        })
+
+        for columns, datetime_format in (
+                (['DAY', 'MONTH', 'YEAR'], '%d-%m-%Y %H%M'),
+                (['YEAR', 'MONTH', 'DAY'], '%Y-%m-%d %H%M'),
+                (['MONTH', 'DAY', 'YEAR'], '%m-%d-%Y %H%M')):
+            processed_df = data_preprocess(
+                parts_df.copy(),
+                dropna=False,
+                datetime_column_info={
+                    'columns': columns,
+                    'time_column': 'SCHEDULED_DEPARTURE',
+                    'format': datetime_format
+                }
+            )
+
+            expected = [
+                datetime.strptime('-'.join(str(row[col]) for col in columns) + ' ' +
+                                  str(row['SCHEDULED_DEPARTURE']).zfill(4),
+                                  datetime_format)
+                for _, row in parts_df.iterrows()
+            ]
+            self.assertListEqual(
+                processed_df['SCHEDULED_DEPARTURE'].tolist(), expected)
+
     if __name__ == '__main__':
         unittest.main()
 
@@ -0,0 +1,142 @@
+"""
+Unit tests for the `main` module.
+
+This module contains tests for the `load_flights` function, which reads the
+flights data through its Parquet cache.
+
+Classes:
+    TestMain: Unit tests for `load_flights` and `_sorted_dictionary` functions.
+
+Functions:
+    test_load_flights: Tests that the loaded rows are filtered and keep their CSV order.
+    test_load_flights_rebuilds_cache: Tests that the cache is rebuilt when the
+    configured columns or dtypes change.
+    test_load_flights_no_rows: Tests that a filter keeping no rows gives an empty frame.
+    test_sorted_dictionary: Tests the Arrow dictionary encoding of the key columns.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import pyarrow as pa
+import config
+from main import _sorted_dictionary, load_flights
+
+
+class TestMain(unittest.TestCase):
+    """
+    Test case for functions in the main module.
+
+    Attributes:
+        tmp_dir (str): Temporary directory holding the sample CSV and its cache.
+    """
+
+    def setUp(self):
+        """
+        Sets up a sample flights CSV and points the configuration at it.
+
+        This method writes a small flights CSV with a missing delay, a delay above
+        the threshold and an airport outside the filter, and patches the config
+        paths and filters so the cache is built in the temporary directory.
+        """
+        self.tmp_dir = tempfile.mkdtemp()
+        csv_path = os.path.join(self.tmp_dir, 'flights.csv')
+        with open(csv_path, 'w') as csv_file:
+            csv_file.write(
+                'YEAR,MONTH,DAY,AIRLINE,FLIGHT_NUMBER,ORIGIN_AIRPORT,'
+                'SCHEDULED_DEPARTURE,DEPARTURE_DELAY\n'
+                '2015,1,1,AA,10,JFK,5,20\n'
+                '2015,1,1,DL,11,LAX,1430,-5\n'
+                '2015,1,2,AA,12,JFK,615,\n'
+                '2015,1,2,UA,13,ORD,900,0\n'
+                '2015,1,3,DL,14,JFK,2359,2000\n'
+                '2015,1,3,UA,15,JFK,1200,30\n'
+            )
+
+        for name, value in (('FLIGHTS_CSV_PATH', csv_path),
+                            ('FLIGHTS_CACHE_PATH', os.path.join(self.tmp_dir, 'cache')),
+                            ('FILTER_AIRPORTS', ['JFK', 'LAX']),
+                            ('DELAY_THRESHOLD', 1440)):
+            patcher = mock.patch.object(config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """
+        Removes the temporary directory.
+        """
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_load_flights(self):
+        """
+        Tests the `load_flights` function for correct filtering and row order.
+
+        This method verifies:
+        - Rows outside the airport filter, above the delay threshold or with a missing
+          value are dropped.
+        - The rows of each airport keep their CSV order.
+        - The key columns are loaded as categories holding only the kept values.
+        """
+        flights_df = load_flights()
+        flights_df = flights_df.sort_values('ORIGIN_AIRPORT', kind='stable')
+
+        self.assertListEqual(flights_df['ORIGIN_AIRPORT'].tolist(), ['JFK', 'JFK', 'LAX'])
+        self.assertListEqual(flights_df['DEPARTURE_DELAY'].tolist(), [20, 30, -5])
+        self.assertListEqual(flights_df['AIRLINE'].cat.categories.tolist(), ['AA', 'DL', 'UA'])
+
+    def test_load_flights_rebuilds_cache(self):
+        """
+        Tests that `load_flights` rebuilds the cache when the configuration changes.
+
+        This method verifies that a column added to `FLIGHTS_COLUMNS`, and a changed
+        dtype in `FLIGHTS_DTYPES`, are read from the rebuilt cache instead of failing
+        on the cache built for the previous configuration.
+        """
+        load_flights()
+
+        with mock.patch.object(config, 'FLIGHTS_COLUMNS',
+                               config.FLIGHTS_COLUMNS + ['FLIGHT_NUMBER']):
+            self.assertListEqual(
+                sorted(load_flights()['FLIGHT_NUMBER'].tolist()), [10, 11, 15])
+
+        with mock.patch.object(config, 'FLIGHTS_DTYPES',
+                               {**config.FLIGHTS_DTYPES, 'DEPARTURE_DELAY': 'float64'}):
+            self.assertEqual(load_flights()['DEPARTURE_DELAY'].dtype, 'float64')
+
+    def test_load_flights_no_rows(self):
+        """
+        Tests that `load_flights` returns an empty frame when the filters keep no rows.
+
+        This method verifies that the key columns of the empty frame are still
+        categorical, instead of the dictionary encoding failing on a column with no
+        chunks.
+        """
+        with mock.patch.object(config, 'FILTER_AIRPORTS', ['ZZZ']):
+            flights_df = load_flights()
+
+        self.assertTrue(flights_df.empty)
+        self.assertListEqual(flights_df.columns.tolist(), config.FLIGHTS_COLUMNS)
+        self.assertEqual(flights_df['ORIGIN_AIRPORT'].dtype, 'category')
+        self.assertEqual(flights_df['AIRLINE'].dtype, 'category')
+
+    def test_sorted_dictionary(self):
+        """
+        Tests the `_sorted_dictionary` function on populated and empty columns.
+
+        This method verifies that the values are kept and the dictionary is sorted
+        across chunks, and that a column with no chunks gives an empty dictionary
+        column.
+        """
+        encoded = _sorted_dictionary(pa.chunked_array([['LAX', 'JFK'], ['SFO', 'JFK']]))
+        self.assertListEqual(encoded.to_pylist(), ['LAX', 'JFK', 'SFO', 'JFK'])
+        self.assertListEqual(encoded.chunk(0).dictionary.to_pylist(), ['JFK', 'LAX', 'SFO'])
+
+        empty = _sorted_dictionary(pa.chunked_array([], type=pa.string()))
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(empty.type, pa.dictionary(pa.int32(), pa.string()))
+
+
+if __name__ == '__main__':
+    unittest.main()